@@ -7,95 +7,146 @@ Sends local PDFs to the Azure Function bulk import endpoint.
 import os
 import json
 import requests
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configuration
 FUNCTION_URL = "http://localhost:7071/api/bulk-import"  # Change to Azure URL for production
 PDF_DIRECTORY = "./pdfs"  # Directory containing your downloaded PDFs
 BASE_URL = "https://disclosures-clerk.house.gov/public_disc/ptr-pdfs/2025/"
+MAX_WORKERS = 8  # Batches submitted concurrently
 
-def get_pdf_files(directory):
-    """Get all PDF files from directory."""
+def iter_pdf_files(directory):
+    """Iterate over the PDF files in directory without listing them all up front."""
     pdf_path = Path(directory)
-    if not pdf_path.exists():
+    if not pdf_path.is_dir():
         print(f"Error: Directory {directory} does not exist")
-        return []
-
-    return list(pdf_path.glob("*.pdf"))
-
-def create_bulk_request(pdf_files):
-    """Create bulk import request payload."""
-    filings = []
+        return iter(())
 
-    for pdf_file in pdf_files:
-        filing_id = pdf_file.stem  # Filename without extension (e.g., "20033318")
+    return pdf_path.glob("*.pdf")
 
-        filings.append({
+def create_bulk_request(filing_ids):
+    """Yield a bulk import request entry for each filing ID."""
+    for filing_id in filing_ids:
+        yield {
             "filingId": filing_id,
             "pdfUrl": f"{BASE_URL}{filing_id}.pdf",  # Use official URL
             "name": "Bulk Import",
             "office": "Unknown"
-        })
-
-    return {"filings": filings}
-
-def submit_bulk_import(request_data, batch_size=10):
-    """Submit filings in batches to avoid overwhelming the system."""
-    filings = request_data["filings"]
-    total = len(filings)
-
-    print(f"Processing {total} filings in batches of {batch_size}...")
-
-    for i in range(0, total, batch_size):
-        batch = filings[i:i + batch_size]
-        batch_request = {"filings": batch}
-
-        print(f"\nSubmitting batch {i//batch_size + 1} ({len(batch)} filings)...")
-
-        try:
-            response = requests.post(
-                FUNCTION_URL,
-                json=batch_request,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                print(f"✓ Queued: {result['queued']}/{result['total']}")
-                if result.get('errors'):
-                    print(f"  Errors: {result['errors']}")
-            else:
-                print(f"✗ Failed: {response.status_code} - {response.text}")
-
-        except Exception as e:
-            print(f"✗ Exception: {str(e)}")
+        }
+
+def create_session():
+    """Create an HTTP session that keeps connections alive between batches.
+
+    Only failures to connect are retried. A POST that reached the server is
+    never resent, so a batch can't be queued twice.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def submit_batch(session, batch):
+    """POST a single batch of filings to the bulk import endpoint."""
+    batch_request = {"filings": batch}
+    body = orjson.dumps(batch_request) if orjson is not None else json.dumps(batch_request)
+
+    return session.post(
+        FUNCTION_URL,
+        data=body,
+        headers={"Content-Type": "application/json"},
+        timeout=30
+    )
+
+def report_batch(batch_num, future):
+    """Print the outcome of a submitted batch."""
+    try:
+        response = future.result()
+
+        if response.status_code == 200:
+            result = response.json()
+            print(f"✓ Batch {batch_num} queued: {result['queued']}/{result['total']}")
+            if result.get('errors'):
+                print(f"  Errors: {result['errors']}")
+        else:
+            print(f"✗ Batch {batch_num} failed: {response.status_code} - {response.text}")
+
+    except Exception as e:
+        print(f"✗ Batch {batch_num} exception: {str(e)}")
+
+def submit_bulk_import(filings, total=None, batch_size=10, max_workers=MAX_WORKERS):
+    """Submit filings in batches to avoid overwhelming the system.
+
+    filings may be any iterable and is consumed lazily. Up to max_workers
+    batches are in flight at once, and at most twice that many are held in
+    memory; results are reported as each batch completes. total, if known,
+    is only used to print the count up front.
+
+    main() still lists the whole directory first, since its confirmation
+    prompt needs the count; only a caller passing a lazy iterable keeps
+    memory independent of the number of files.
+    """
+    if total is not None:
+        print(f"Processing {total} filings in batches of {batch_size}...")
+
+    filings = iter(filings)
+
+    with create_session() as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        batch_num = 0
+
+        while batch := list(islice(filings, batch_size)):
+            batch_num += 1
+
+            print(f"\nSubmitting batch {batch_num} ({len(batch)} filings)...")
+            pending[executor.submit(submit_batch, session, batch)] = batch_num
+
+            if len(pending) >= max_workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    report_batch(pending.pop(future), future)
+
+        for future in as_completed(pending):
+            report_batch(pending[future], future)
 
 def main():
     """Main entry point."""
     print("Congressional Filing Bulk Import")
     print("=" * 50)
 
-    # Get PDF files
-    pdf_files = get_pdf_files(PDF_DIRECTORY)
+    # List the directory once, keeping only the filing IDs: the filename
+    # without extension (e.g., "20033318")
+    filing_ids = [pdf_file.stem for pdf_file in iter_pdf_files(PDF_DIRECTORY)]
+    total = len(filing_ids)
 
-    if not pdf_files:
+    if not total:
         print(f"No PDF files found in {PDF_DIRECTORY}")
         return
 
-    print(f"Found {len(pdf_files)} PDF files")
-
-    # Create request
-    request_data = create_bulk_request(pdf_files)
+    print(f"Found {total} PDF files")
 
     # Confirm
-    response = input(f"\nSubmit {len(pdf_files)} filings for processing? (yes/no): ")
+    response = input(f"\nSubmit {total} filings for processing? (yes/no): ")
     if response.lower() not in ['yes', 'y']:
         print("Cancelled")
         return
 
     # Submit
-    submit_bulk_import(request_data, batch_size=10)
+    filings = create_bulk_request(filing_ids)
+    submit_bulk_import(filings, total=total, batch_size=10)
 
     print("\n" + "=" * 50)
     print("Bulk import complete!")
@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""
+Single-pass analysis of the House committee roster PDF (scsoal.pdf).
+
+Each page's text is extracted once and handed to every visitor passed to
+scan(), so the committee extraction, the Pete Sessions lookup and the
+subcommittee debug dump can share one read of the PDF.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import platform
+import argparse
+import re
+import sys
+import tempfile
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+import pdfminer
+import pdfplumber
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+PDF_PATH = '/Users/Luis/dev/congress-stock-trades/examples/scsoal.pdf'
+OUTPUT_FILE = '/Users/Luis/dev/congress-stock-trades/pdf_analysis_results.json'
+PARQUET_FILE = '/Users/Luis/dev/congress-stock-trades/pdf_analysis_results.parquet'
+
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'congress-stock-trades'
+
+# Patterns used while scanning every line of the PDF, compiled once at import.
+SUBCOMMITTEE_HDR = re.compile(r'SUBCOMMITTEES?\s+OF\s+THE\s+COMMITTEE\s+ON', re.IGNORECASE)
+ON_SUFFIX = re.compile(r'ON\s+(.+)$', re.IGNORECASE)
+# Member entries, scanned once per line. The first branch matches numbered
+# members (e.g., "3. Pete Sessions, TX"), the second non-numbered members in
+# subcommittees (e.g., "Pete Sessions, TX Juan Vargas, CA").
+MEMBER = re.compile(
+    r"(?:(?P<num>\d+)\.\s*(?P<nname>[A-Za-z\s\.\-\']+?),\s*(?P<nstate>[A-Z]{2}))"
+    r"|(?:(?P<uname>[A-Z][A-Za-z\s\.\-\']+?),\s*(?P<ustate>[A-Z]{2})(?:\s*,\s*[A-Za-z]+)?)"
+)
+# Boilerplate headers that are neither committees nor subcommittees
+SKIP = re.compile(
+    r'STANDING COMMITTEES|SELECT COMMITTEES|JOINT COMMITTEES|ALPHABETICAL LIST'
+    r'|HOUSE OF REPRESENTATIVES|ONE HUNDRED|CONGRESS|MAJORITY|MINORITY|DEMOCRATS'
+    r'|REPUBLICANS|RATIO|WASHINGTON|CONTENTS|PREPARED UNDER'
+)
+WS = re.compile(r'\s+')
+# Collapses whitespace and splits concatenated names ("SessionsJuan") in one pass
+NAME_CLEAN = re.compile(r'([a-z])([A-Z])|\s+')
+# "Sessions" together with his first name or state, in either order
+SESSIONS_TEST = re.compile(r'Sessions.*(?:Pete|TX)|(?:Pete|TX).*Sessions')
+
+def iter_page_text(pdf_path, pages=None):
+    """Yield (page_num, text) for each page, releasing the page once read.
+
+    pages optionally restricts the scan to the given 1-based page numbers.
+    Only one page is held open at a time, so memory stays flat regardless
+    of the length of the PDF.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num in pages if pages is not None else range(1, len(pdf.pages) + 1):
+            page = pdf.pages[page_num - 1]
+            try:
+                text = page.extract_text(layout=False)
+            finally:
+                page.close()
+            yield page_num, text
+
+def count_pages(pdf_path):
+    """Return the number of pages in the PDF."""
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
+
+def _read_page_range(pdf_path, start, stop):
+    # Runs in a worker process, which opens its own handle on the PDF since
+    # open PDF documents can't be shared across processes.
+    return list(iter_page_text(pdf_path, pages=range(start, stop)))
+
+def iter_page_text_parallel(pdf_path, workers):
+    """Yield (page_num, text) in page order, extracting ranges of pages in parallel.
+
+    Text extraction is split into contiguous page ranges, one per worker
+    process; the caller still receives pages in order so that parsing state
+    can carry over from one page to the next.
+
+    Worth it on a multi-core machine: pdfplumber needs about 50ms per page,
+    while each spawned worker costs a fraction of a second to import this
+    module and its dependencies. Each worker's whole page range of text is
+    held in memory until consumed.
+    """
+    page_count = count_pages(pdf_path)
+    workers = min(workers, page_count)
+    if workers < 2:
+        yield from iter_page_text(pdf_path)
+        return
+
+    chunk = -(-page_count // workers)
+    starts = range(1, page_count + 1, chunk)
+    stops = [min(start + chunk, page_count + 1) for start in starts]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for pages in executor.map(_read_page_range, repeat(pdf_path), starts, stops):
+            yield from pages
+
+def _library_signature():
+    """Describe the PDF libraries and regex module whose output gets cached."""
+    return (
+        f"pdfplumber=={pdfplumber.__version__};pdfminer=={pdfminer.__version__};"
+        f"{re.__name__};python=={platform.python_version()}"
+    )
+
+def disk_cache(func):
+    """Cache the results of func(pdf_path) on disk, keyed by the PDF's contents.
+
+    The key also covers the source file defining func and the versions of the
+    PDF libraries and regex module in use, since each of them changes the
+    extracted results.
+
+    Every edit to that source file changes the key, and entries written under
+    old keys are never removed; delete CACHE_DIR to reclaim the space.
+
+    Keyword arguments are passed through to func but are not part of the key,
+    so they must only affect how the result is computed (e.g. workers).
+    """
+    source = Path(inspect.getsourcefile(func)).read_bytes()
+    libraries = _library_signature()
+
+    @functools.wraps(func)
+    def wrapper(pdf_path, **options):
+        digest = hashlib.blake2b(source, digest_size=16)
+        digest.update(func.__qualname__.encode())
+        digest.update(libraries.encode())
+        with open(pdf_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+
+        cache_file = CACHE_DIR / f"{digest.hexdigest()}.pkl"
+        if cache_file.exists():
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+
+        result = func(pdf_path, **options)
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # A uniquely named temp file, so concurrent runs caching the same key
+        # never write into the same file before the rename.
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix='.tmp', delete=False) as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, cache_file)
+        return result
+
+    return wrapper
+
+def _clean_name_match(m):
+    return f"{m.group(1)} {m.group(2)}" if m.group(1) else ' '
+
+class ParseState:
+    """Committee context and results carried from one page to the next."""
+
+    __slots__ = (
+        'records',
+        'current_committee', 'current_subcommittee', 'in_subcommittee_section', 'is_majority'
+    )
+
+    def __init__(self):
+        # One (member_key, committee, subcommittee, position, page, group, raw_line)
+        # tuple per assignment, in document order; grouped once in result().
+        self.records = []
+
+        self.current_committee = None
+        self.current_subcommittee = None
+        self.in_subcommittee_section = False
+        self.is_majority = True
+
+    def result(self):
+        return group_assignments(self.records)
+
+def group_assignments(records):
+    """Group the flat assignment records into the committee data dict."""
+    committees = {}
+    subcommittees = {}
+    member_assignments = {}
+
+    for member_key, committee, subcommittee, position, page_num, group, raw_line in records:
+        member_assignments.setdefault(member_key, []).append({
+            'committee': committee,
+            'subcommittee': subcommittee,
+            'position': position,
+            'page': page_num,
+            'group': group,
+            'raw_line': raw_line
+        })
+
+        if subcommittee:
+            subcommittees.setdefault(committee, {}).setdefault(subcommittee, []).append(member_key)
+        else:
+            committees.setdefault(committee, []).append(member_key)
+
+    return {
+        'committees': committees,
+        'subcommittees': subcommittees,
+        'members': sorted(member_assignments),
+        'member_assignments': member_assignments
+    }
+
+def parse_page(text, page_num, state):
+    """Parse the committee assignments on one page of text into state."""
+
+    # The line loop is the hot path, so keep the context in locals and bind
+    # the methods it calls up front instead of looking them up per line.
+    current_committee = state.current_committee
+    current_subcommittee = state.current_subcommittee
+    in_subcommittee_section = state.in_subcommittee_section
+    is_majority = state.is_majority
+
+    add_record = state.records.append
+
+    subcommittee_hdr = SUBCOMMITTEE_HDR.match
+    skip = SKIP.search
+    find_members = MEMBER.finditer
+    # Member keys and committee names repeat across thousands of records;
+    # interning makes every record share one string object per distinct name.
+    intern = sys.intern
+    collapse_ws = WS.sub
+    clean_name = NAME_CLEAN.sub
+
+    for line in text.split('\n'):
+        line = line.strip()
+
+        if not line:
+            continue
+
+        # Check for subcommittee section header
+        if subcommittee_hdr(line):
+            in_subcommittee_section = True
+            match = ON_SUFFIX.search(line)
+            if match:
+                current_committee = intern(match.group(1).strip())
+                current_subcommittee = None
+            continue
+
+        # Check for main committee headers (all caps, but not subcommittee headers)
+        if line.isupper() and len(line) > 3 and not line.startswith('SUBCOMMITTEE'):
+            # Skip common headers
+            if skip(line):
+                if 'MAJORITY' in line:
+                    is_majority = True
+                elif 'MINORITY' in line:
+                    is_majority = False
+                continue
+
+            # This could be a committee or subcommittee name
+            if in_subcommittee_section and current_committee:
+                # It's a subcommittee
+                current_subcommittee = intern(line)
+            else:
+                # It's a main committee
+                current_committee = intern(line)
+                current_subcommittee = None
+                in_subcommittee_section = False
+                is_majority = True
+            continue
+
+        # Parse member lines. Numbered entries take precedence; the
+        # non-numbered ones only count inside a subcommittee.
+        matches = []
+        non_numbered_matches = []
+        for m in find_members(line):
+            if m.group('num'):
+                matches.append(m.group('num', 'nname', 'nstate'))
+            else:
+                non_numbered_matches.append(m.group('uname', 'ustate'))
+
+        if matches:
+            group = 'Majority' if is_majority else 'Minority'
+            for position, name, state_code in matches:
+                name = collapse_ws(' ', name).strip()
+                add_record((
+                    intern(f"{name}, {state_code}"), current_committee, current_subcommittee,
+                    int(position), page_num, group, line
+                ))
+
+        elif current_subcommittee and non_numbered_matches:
+            for i, (name, state_code) in enumerate(non_numbered_matches):
+                # Normalize whitespace and fix concatenated names
+                name = clean_name(_clean_name_match, name).strip()
+                # No position for subcommittee members
+                add_record((
+                    intern(f"{name}, {state_code}"), current_committee, current_subcommittee,
+                    0, page_num, 'Majority' if i == 0 else 'Minority', line
+                ))
+
+    state.current_committee = current_committee
+    state.current_subcommittee = current_subcommittee
+    state.in_subcommittee_section = in_subcommittee_section
+    state.is_majority = is_majority
+
+class PageVisitor(ABC):
+    """Receives the text of each page during scan().
+
+    pages lists the 1-based page numbers the visitor needs, or None for
+    every page.
+    """
+
+    pages = None
+
+    @abstractmethod
+    def visit_page(self, page_num, text):
+        """Process the text of one page."""
+
+    @abstractmethod
+    def result(self):
+        """Return what the visitor collected over the scan."""
+
+class FullExtractVisitor(PageVisitor):
+    """Collect all committee and subcommittee assignments."""
+
+    def __init__(self):
+        self.state = ParseState()
+
+    def visit_page(self, page_num, text):
+        if text:
+            parse_page(text, page_num, self.state)
+
+    def result(self):
+        return self.state.result()
+
+class PeteSessionsVisitor(PageVisitor):
+    """Collect every line mentioning Pete Sessions with its committee context."""
+
+    def __init__(self):
+        self.occurrences = []
+        # Any line mentioning Sessions, only reported if nothing matched
+        self.sessions_lines = []
+
+    def visit_page(self, page_num, text):
+        if not text:
+            return
+
+        # Most recent all-caps committee name seen on this page
+        last_header = 'Unknown'
+        for line in text.split('\n'):
+            stripped = line.strip()
+            if stripped and stripped.isupper() and len(stripped) > 3 and not stripped.startswith('SUBCOMMITTEE'):
+                last_header = stripped
+            # Search for Sessions in various formats
+            elif SESSIONS_TEST.search(line):
+                self.occurrences.append({
+                    'page': page_num,
+                    'line': stripped,
+                    'context': last_header
+                })
+            elif 'Sessions' in line:
+                self.sessions_lines.append(stripped)
+
+    def result(self):
+        return self.occurrences, self.sessions_lines
+
+class SubcommitteeDebugVisitor(PageVisitor):
+    """Collect the headers and Sessions lines on the pages where he sits on subcommittees."""
+
+    # Pages where Pete Sessions appears in subcommittees
+    def __init__(self, pages=(23, 24, 25, 39, 40, 41)):
+        self.pages = pages
+        self.report_lines = []
+
+    def visit_page(self, page_num, text):
+        out = self.report_lines.append
+        out(f"\n{'='*80}")
+        out(f"PAGE {page_num}")
+        out('='*80)
+
+        lines = text.split('\n')
+
+        # Look for committee/subcommittee headers and Pete Sessions
+        for i, line in enumerate(lines):
+            # Print committee/subcommittee headers
+            if line.strip().isupper() and len(line.strip()) > 3:
+                out(f"HEADER: {line.strip()}")
+
+            # Print lines containing Sessions
+            if 'Sessions' in line:
+                out(f"SESSIONS LINE {i}: '{line.strip()}'")
+                # Show context
+                if i > 0:
+                    out(f"  PREVIOUS: '{lines[i-1].strip()}'")
+                if i < len(lines) - 1:
+                    out(f"  NEXT: '{lines[i+1].strip()}'")
+
+    def result(self):
+        return self.report_lines
+
+def scan(pdf_path, visitors, workers=None):
+    """Extract each page's text once and pass it to every visitor that wants it.
+
+    Only the pages some visitor asks for are read. Pages are read one at a
+    time unless workers is given and every page is needed, in which case
+    extraction is spread over that many processes.
+    """
+    if any(visitor.pages is None for visitor in visitors):
+        if workers:
+            page_texts = iter_page_text_parallel(pdf_path, workers)
+        else:
+            page_texts = iter_page_text(pdf_path)
+    else:
+        page_texts = iter_page_text(pdf_path, pages=sorted({p for v in visitors for p in v.pages}))
+
+    for page_num, text in page_texts:
+        for visitor in visitors:
+            if visitor.pages is None or page_num in visitor.pages:
+                visitor.visit_page(page_num, text)
+
+@disk_cache
+def extract_assignment_records(pdf_path, workers=None):
+    """Extract the flat assignment records (see ParseState) from the PDF."""
+    visitor = FullExtractVisitor()
+    scan(pdf_path, [visitor], workers=workers)
+    return visitor.state.records
+
+def extract_all_committee_data(pdf_path):
+    """Extract all committee assignments from the PDF for comparison."""
+    return group_assignments(extract_assignment_records(pdf_path))
+
+@disk_cache
+def extract_pete_sessions_occurrences(pdf_path):
+    """Extract all occurrences of Pete Sessions from the PDF.
+
+    Returns (occurrences, sessions_lines), where sessions_lines holds the
+    other lines mentioning Sessions for reporting when nothing matched.
+    """
+    visitor = PeteSessionsVisitor()
+    scan(pdf_path, [visitor])
+    return visitor.result()
+
+@disk_cache
+def run_all_analyses(pdf_path, workers=None):
+    """Run all three analyses over a single pass of the PDF.
+
+    Returns (committee_data, (occurrences, sessions_lines), subcommittee_lines).
+    """
+    visitors = [FullExtractVisitor(), PeteSessionsVisitor(), SubcommitteeDebugVisitor()]
+    scan(pdf_path, visitors, workers=workers)
+    return tuple(visitor.result() for visitor in visitors)
+
+def write_assignments_parquet(records, output_file):
+    """Write one row per assignment record to a zstd-compressed Parquet file.
+
+    Member, committee, subcommittee and group names repeat across many rows,
+    so those columns are dictionary-encoded. Requires pyarrow.
+    """
+    member, committee, subcommittee, position, page, group, raw_line = list(zip(*records)) or [()] * 7
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+
+    table = pa.table({
+        'member': pa.array(member, type=dictionary),
+        'committee': pa.array(committee, type=dictionary),
+        'subcommittee': pa.array(subcommittee, type=dictionary),
+        'position': pa.array(position, type=pa.int32()),
+        'page': pa.array(page, type=pa.int32()),
+        'group': pa.array(group, type=dictionary),
+        'raw_line': pa.array(raw_line, type=pa.string())
+    })
+    pq.write_table(table, output_file, compression='zstd')
+
+def print_committee_report(data, output_file=OUTPUT_FILE):
+    """Print statistics and Pete Sessions' assignments, and save the full data as JSON."""
+
+    # Statistics
+    print(f"\nStatistics:")
+    print(f"  Total Committees: {len(data['committees'])}")
+    print(f"  Total Subcommittees: {sum(len(subs) for subs in data['subcommittees'].values())}")
+    print(f"  Total Members: {len(data['members'])}")
+    print(f"  Total Assignments: {sum(len(assignments) for assignments in data['member_assignments'].values())}")
+
+    # Find Pete Sessions
+    pete_sessions_assignments = []
+    for member, assignments in data['member_assignments'].items():
+        if 'Sessions' in member and 'Pete' in member:
+            pete_sessions_assignments.extend(assignments)
+
+    print(f"\n{'=' * 80}")
+    print(f"PETE SESSIONS ANALYSIS")
+    print(f"{'=' * 80}")
+    print(f"Total Pete Sessions Assignments Found: {len(pete_sessions_assignments)}")
+
+    for i, assignment in enumerate(sorted(pete_sessions_assignments, key=lambda x: x['page']), 1):
+        print(f"\n{i}. Page {assignment['page']}:")
+        print(f"   Committee: {assignment['committee']}")
+        if assignment['subcommittee']:
+            print(f"   Subcommittee: {assignment['subcommittee']}")
+        else:
+            print(f"   Type: Main Committee")
+        print(f"   Group: {assignment['group']}")
+        if assignment['position'] > 0:
+            print(f"   Position: #{assignment['position']}")
+        print(f"   Raw: \"{assignment['raw_line'][:80]}...\"" if len(assignment['raw_line']) > 80
+              else f"   Raw: \"{assignment['raw_line']}\"")
+
+    # Save detailed results to JSON
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(data, f, indent=2)
+    print(f"\n\nDetailed results saved to: {output_file}")
+
+def print_subcommittee_report(report_lines):
+    """Print the lines collected by SubcommitteeDebugVisitor."""
+    for line in report_lines:
+        print(line)
+
+def print_pete_sessions_report(occurrences, sessions_lines=()):
+    """Print each Pete Sessions occurrence, grouped by committee."""
+
+    # If no occurrences found, let's search more broadly
+    if not occurrences:
+        print("\nNo direct matches found. Searching for 'Sessions' in all text...")
+        for line in sessions_lines:
+            print(f"  Found: {line}")
+
+    print(f"\nFound {len(occurrences)} occurrences of Pete Sessions:")
+    print("-" * 80)
+
+    for occ in occurrences:
+        print(f"\nPage {occ['page']}:")
+        print(f"  Line: {occ['line']}")
+        print(f"  Context: {occ['context']}")
+
+    # Group by context to understand committee assignments
+    print("\n" + "=" * 80)
+    print("Summary of Pete Sessions' committee assignments:")
+    print("-" * 80)
+
+    committees = {}
+    for occ in occurrences:
+        ctx = occ['context']
+        if ctx not in committees:
+            committees[ctx] = []
+        committees[ctx].append(occ['line'])
+
+    for committee, lines in committees.items():
+        print(f"\n{committee}:")
+        for line in lines:
+            print(f"  - {line}")
+
+def main():
+    """Run all three analyses over a single pass of the PDF."""
+    parser = argparse.ArgumentParser(description="Run all analyses of the SCSOAL PDF in one pass.")
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help="extract page text in N worker processes (default: serially)")
+    args = parser.parse_args()
+
+    print("Analyzing SCSOAL PDF...")
+    print("=" * 80)
+
+    data, pete_sessions, subcommittee_lines = run_all_analyses(PDF_PATH, workers=args.workers)
+
+    print_subcommittee_report(subcommittee_lines)
+    print_committee_report(data)
+    print_pete_sessions_report(*pete_sessions)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file